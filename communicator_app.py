@@ -22,8 +22,10 @@ from __future__ import annotations
 import base64
 import json
 import os
+import re
 import threading
 import time
+import traceback
 from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional, Tuple
@@ -414,7 +416,6 @@ class CommunicatorApplication:
         except Exception as e:
             # Fallback to simple rectangle if geopandas fails
             print(f"[ERROR] GeoPandas map rendering failed: {e}")
-            import traceback
             traceback.print_exc()
             self.map_canvas.create_rectangle(0, 0, w, h, fill="#d4e5f7", outline="#c0c0c0", tags="bg")
             self._draw_continents(w, h)
@@ -694,7 +695,6 @@ class CommunicatorApplication:
     def _maybe_extract_location(self, message_text: str):
         """Extract LOCATION payload from message and update map (REQ012, SDD002, SDD047)."""
         try:
-            import re
             # Match ["LOCATION", "lat", "lon"] format
             match = re.search(r'\["LOCATION",\s*"(-?\d+\.?\d*)",\s*"(-?\d+\.?\d*)"\]', message_text)
             if match:
@@ -1,5 +1,6 @@
 """Murata Type 1SC-NTN device profile implementation (SDD030, based on client.ttl)."""
 
+import queue
 import re
 import time
 from typing import Optional, Tuple, Dict
@@ -32,7 +33,6 @@ class MurataType1SCProfile(BaseDeviceProfile):
         
         Implements complete Murata Type 1SC-NTN NTN initialization with GNSS.
         """
-        import time
         
         # Phase 1: Initial configuration
         commands_phase1 = [
@@ -154,7 +154,6 @@ class MurataType1SCProfile(BaseDeviceProfile):
 
     def _wait_for_sib31(self, serial_manager, timeout: float) -> bool:
         """Wait for %NOTIFYEV: "SIB31" satellite detection (SDD034)."""
-        import time
 
         start = time.time()
         while time.time() - start < timeout:
@@ -172,8 +171,9 @@ class MurataType1SCProfile(BaseDeviceProfile):
     
     def _send_and_wait_boot(self, serial_manager, cmd: str) -> bool:
         """Send command and wait for %BOOTEV:0 URC."""
-        import time
         with serial_manager.command_lock:
+            any_line = serial_manager.any_line
+            any_line.clear()
             try:
                 serial_manager.serial_port.write((cmd + "\r\n").encode())
             except Exception as e:
@@ -188,26 +188,33 @@ class MurataType1SCProfile(BaseDeviceProfile):
             except Exception:
                 pass
 
-            start = time.time()
-            timeout = 40.0
+            deadline = time.monotonic() + 40.0
             got_boot = False
-            while time.time() - start < timeout:
+            # Sleep until a line lands on either queue, then take everything queued so far
+            while True:
+                any_line.clear()
                 try:
-                    evt = serial_manager.event_queue.get(timeout=0.2)
-                    if hasattr(serial_manager, 'app') and serial_manager.app:
-                        serial_manager.app.log_message("recv", f"[RECV] {evt}")
-                    if "%BOOTEV:0" in evt:
-                        got_boot = True
-                        break
-                except:
+                    while True:
+                        evt = serial_manager.event_queue.get_nowait()
+                        if hasattr(serial_manager, 'app') and serial_manager.app:
+                            serial_manager.app.log_message("recv", f"[RECV] {evt}")
+                        if "%BOOTEV:0" in evt:
+                            got_boot = True
+                            break
+                except queue.Empty:
                     pass
                 # Also drain response queue
                 try:
-                    resp = serial_manager.response_queue.get_nowait()
-                    if hasattr(serial_manager, 'app') and serial_manager.app:
-                        serial_manager.app.log_message("recv", f"[RECV] {resp}")
-                except:
+                    while True:
+                        resp = serial_manager.response_queue.get_nowait()
+                        if hasattr(serial_manager, 'app') and serial_manager.app:
+                            serial_manager.app.log_message("recv", f"[RECV] {resp}")
+                except queue.Empty:
                     pass
+                remaining = deadline - time.monotonic()
+                if got_boot or remaining <= 0:
+                    break
+                any_line.wait(remaining)
             
             if not got_boot:
                 if hasattr(serial_manager, 'app') and serial_manager.app:
@@ -217,8 +224,6 @@ class MurataType1SCProfile(BaseDeviceProfile):
     
     def _wait_for_gnss_fix(self, serial_manager, timeout: float) -> bool:
         """Wait for GNSS fix URC (%IGNSSEVU:FIX) and extract location (REQ012, SDD034)."""
-        import time
-        import re
         start = time.time()
         while time.time() - start < timeout:
             try:
@@ -275,8 +280,6 @@ class MurataType1SCProfile(BaseDeviceProfile):
                     serial_manager.app.log_message("sys", "[INFO] Waiting for %SOCKETCMD notification after ALLOCATE (SDD042)...")
                 
                 # Poll for %SOCKETCMD notification from app state (avoids event_queue race)
-                import time
-                import re
                 start_wait = time.time()
                 socketcmd_received = None
                 listen_socket_id = None
@@ -362,7 +365,6 @@ class MurataType1SCProfile(BaseDeviceProfile):
                 return False
 
             # Wait for %SOCKETCMD notification
-            import time
             start_wait = time.time()
             while time.time() - start_wait < 5.0:
                 app = getattr(serial_manager, 'app', None)
@@ -433,7 +435,6 @@ class MurataType1SCProfile(BaseDeviceProfile):
         if hasattr(serial_manager, 'app') and serial_manager.app:
             serial_manager.app.log_message("sys", "[INFO] Waiting for %PINGCMD notification (timeout=30s)...")
 
-        import time
         start_wait = time.time()
         timeout_wait = 30.0
 
@@ -654,7 +655,7 @@ class MurataType1SCProfile(BaseDeviceProfile):
             # (from client.ttl: 'RSRP = (-?\d+), RSRQ = (-?\d+), SINR = (-?\d+), RSSI = (-?\d+)')
             match = re.search(
                 r'RSRP\s*=\s*(-?\d+),\s*RSRQ\s*=\s*(-?\d+),\s*SINR\s*=\s*(-?\d+),\s*RSSI\s*=\s*(-?\d+)',
-                str(response)
+                response
             )
             if match:
                 return {
@@ -4,6 +4,41 @@ import re
 from typing import Optional, Tuple, Dict
 from .base_device import BaseDeviceProfile
 
+# AT#XRECVFROM response as joined by SerialManager.send_command (" | ") or as raw lines:
+# header (size, ip_addr, port), optional payload line, optional final result code
+_XRECVFROM_RE = re.compile(
+    r'#XRECVFROM:\s*(\d+),\s*"?([^",]+)"?,\s*(\d+)'
+    r'(?:(?: \| |\r?\n)(?!(?:OK|ERROR)\s*$)(.*?))?'
+    r'(?:(?: \| |\r?\n)(?:OK|ERROR))?\s*$',
+    re.S,
+)
+_XSENDTO_RE = re.compile(r'#XSENDTO:\s*(\d+)')
+
+
+def _parse_xrecvfrom(response: str) -> Optional[Tuple[str, int, str]]:
+    """
+    Parse an AT#XRECVFROM response into (ip_addr, port, payload) (SDD041).
+
+    Returns: (ip_address, port, payload) or None if no #XRECVFROM header is found
+    """
+    # Fast path for the usual send_command shape, no regex or line list:
+    # #XRECVFROM: <size>,"<ip_addr>",<port> | <data> | OK
+    header, _, rest = response.partition(" | ")
+    if header.startswith("#XRECVFROM:"):
+        data, _, result = rest.rpartition(" | ")
+        fields = header[len("#XRECVFROM:"):].split(",", 2)
+        if result == "OK" and len(fields) == 3:
+            size_field, ip_field, port_field = fields
+            port_field = port_field.strip()
+            if size_field.strip().isdigit() and port_field.isdigit():
+                return (ip_field.strip().strip('"'), int(port_field), data.strip())
+
+    # Anything else (raw CRLF lines, leading text): header, payload and result code in one scan
+    match = _XRECVFROM_RE.search(response)
+    if not match:
+        return None
+    return (match.group(2).strip(), int(match.group(3)), (match.group(4) or "").strip())
+
 
 class NordicThingy91XProfile(BaseDeviceProfile):
     """
@@ -17,6 +52,12 @@ class NordicThingy91XProfile(BaseDeviceProfile):
     - Response format: #XRECVFROM: <size>,<ip_addr>,<port> followed by <data>
     """
 
+    def __init__(self):
+        # AT#XRECVFROM command and its [SEND] log line, rebuilt only when the buffer size changes
+        self._recv_buffer_size = None
+        self._recv_cmd = ""
+        self._recv_log = ""
+
     def get_device_info(self) -> Dict[str, str]:
         """Return device metadata."""
         return {
@@ -133,13 +174,9 @@ class NordicThingy91XProfile(BaseDeviceProfile):
         if success:
             if response:
                 # Parse response format: #XSENDTO: <size> per SDD019
-                if "#XSENDTO:" in str(response):
-                    try:
-                        size_str = str(response).split("#XSENDTO:")[1].strip()
-                        size = int(size_str.split()[0])
-                        return size > 0
-                    except (ValueError, IndexError):
-                        return True  # Command succeeded even if parsing fails
+                match = _XSENDTO_RE.search(response)
+                if match:
+                    return int(match.group(1)) > 0
             return True  # OK response is success
         return False
 
@@ -161,77 +198,38 @@ class NordicThingy91XProfile(BaseDeviceProfile):
         
         Returns: (ip_address, port, payload) or None on failure/timeout
         """
-        cmd = f"AT#XRECVFROM={buffer_size}"
+        if buffer_size != self._recv_buffer_size:
+            self._recv_cmd = f"AT#XRECVFROM={buffer_size}"
+            self._recv_log = f"[SEND] {self._recv_cmd} - Receive UDP data"
+            self._recv_buffer_size = buffer_size
         
         if hasattr(serial_manager, 'app') and serial_manager.app:
-            serial_manager.app.log_message("sent", f"[SEND] {cmd} - Receive UDP data")
+            serial_manager.app.log_message("sent", self._recv_log)
         
-        success, response = serial_manager.send_command(cmd, timeout=5.0)
+        success, response = serial_manager.send_command(self._recv_cmd, timeout=5.0)
 
-        if hasattr(serial_manager, 'app') and serial_manager.app and response:
-            serial_manager.app.log_message("recv", f"[RECV] {response}")
+        # Raw trace only when the application has verbose logging enabled (SDD012)
+        if (hasattr(serial_manager, 'app') and serial_manager.app and response
+                and getattr(serial_manager.app, 'verbose_log', True)):
+            serial_manager.app.log_message("recv", "[RECV] " + response)
 
         if not success or not response:
             return None
 
-        response_str = str(response)
-
-        # Parse #XRECVFROM header line
-        if "#XRECVFROM:" not in response_str:
+        parsed = _parse_xrecvfrom(response)
+        if parsed is None:
             return None
 
-        try:
-            # Response format: #XRECVFROM: <size>,"<ip_addr>",<port> | <data> | OK
-            # Check if response contains pipe separators (single-line format)
-            if " | " in response_str:
-                parts = response_str.split(" | ")
-                header_part = parts[0].strip()
-                data_part = parts[1].strip() if len(parts) > 1 else ""
-            else:
-                # Multi-line format (fallback)
-                lines = response_str.split('\n')
-                header_part = None
-                data_part = None
-                
-                for line in lines:
-                    if "#XRECVFROM:" in line:
-                        header_part = line
-                    elif line.strip() and not line.startswith("#") and not line.startswith("+"):
-                        if "OK" not in line and "ERROR" not in line:
-                            data_part = line
-                
-                if not header_part:
-                    return None
-
-            # Parse header: #XRECVFROM: <size>,"<ip_addr>",<port>
-            header_match = re.search(
-                r'#XRECVFROM:\s*(\d+),\s*"?([^",]+)"?,\s*(\d+)',
-                header_part
-            )
-
-            if not header_match:
-                return None
-
-            size = int(header_match.group(1))
-            ip_addr = header_match.group(2).strip('"').strip("'").strip()
-            port = int(header_match.group(3))
-
-            # Get payload from parsed data
-            payload = data_part.strip() if data_part else ""
-
-            # SDD041 step 6: Display message only when received from ip_addr="100.127.10.16"
-            if ip_addr != "100.127.10.16":
-                if hasattr(serial_manager, 'app') and serial_manager.app:
-                    serial_manager.app.log_message("sys", f"[FILTER] Ignoring message from {ip_addr} (not 100.127.10.16)")
-                return None
-
-            return (ip_addr, port, payload)
-
-        except (ValueError, IndexError, AttributeError) as e:
+        ip_addr, port, payload = parsed
+
+        # SDD041 step 6: Display message only when received from ip_addr="100.127.10.16"
+        if ip_addr != "100.127.10.16":
             if hasattr(serial_manager, 'app') and serial_manager.app:
-                serial_manager.app.log_message("sys", f"[ERROR] Failed to parse #XRECVFROM response: {e}")
+                serial_manager.app.log_message("sys", f"[FILTER] Ignoring message from {ip_addr} (not 100.127.10.16)")
             return None
 
+        return (ip_addr, port, payload)
+
     def get_signal_quality(self, serial_manager) -> Optional[Dict[str, int]]:
         """Query signal quality metrics via AT%CESQ (SDD015)."""
         cmd = "AT%CESQ"
@@ -242,7 +240,7 @@ class NordicThingy91XProfile(BaseDeviceProfile):
 
         try:
             # Parse %CESQ response format: %CESQ: <rsrp>,<rsrq>,<sinr>
-            match = re.search(r'%CESQ:\s*(-?\d+),\s*(-?\d+),\s*(-?\d+)', str(response))
+            match = re.search(r'%CESQ:\s*(-?\d+),\s*(-?\d+),\s*(-?\d+)', response)
             if match:
                 return {
                     'rsrp': int(match.group(1)),
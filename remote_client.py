@@ -28,8 +28,18 @@ Design specified in Software Design Document (SDD):
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, simpledialog
+from collections import deque
 from datetime import datetime
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
+import os
+import selectors
+import struct
+import sys
 import threading
+import time
+import traceback
 import queue
 import re
 import serial
@@ -38,6 +48,104 @@ import serial.tools.list_ports
 from device_profiles import DeviceProfileFactory
 
 
+# Linux TIOCGSERIAL/TIOCSSERIAL access to struct serial_struct (linux/serial.h)
+_TIOCGSERIAL = 0x541E
+_TIOCSSERIAL = 0x541F
+_SERIAL_STRUCT_SIZE = 72
+_SERIAL_FLAGS_OFFSET = 16  # after int type, int line, unsigned int port, int irq
+_ASYNC_LOW_LATENCY = 0x2000
+
+# Driver RX/TX queue size requested where pyserial supports it (Windows)
+_SERIAL_BUFFER_SIZE = 65536
+
+# Upper bound for one os.read() of the serial fd; returns whatever is available
+_READ_CHUNK_SIZE = 65536
+
+# ITU-T V.250 5.2.1: at least 0.1s between a final result code and the next command line (SDD017)
+_MIN_GUARD_TIME = 0.1
+
+# Final result codes that end a command's response (ITU-T V.250)
+_FINAL_RESULT_CODES = ("OK", "ERROR")
+
+# Per-adapter USB-serial attributes (latency_timer on FTDI), keyed by tty name
+_USB_SERIAL_SYSFS = "/sys/bus/usb-serial/devices"
+
+# URC parameter parsers, matched from the start of the line (SDD013, SDD015, SDD042)
+_CEREG_URC_RE = re.compile(r"\+CEREG:\s*(\d+)\s*(?:,|$)")  # <stat> must be a whole field
+_CESQ_URC_RE = re.compile(r"%CESQ:\s*(\d+)")
+_SOCKETEV_URC_RE = re.compile(r"%SOCKETEV:\s*(\d+),\s*(\d+)")
+
+# Latitude/longitude embedded in URCs or data strings (REQ012): quoted decimal pair, or lat/lng keys
+_LOCATION_PAIR_RE = re.compile(r'"(-?\d{1,3}\.\d+)",\s*"(-?\d{1,3}\.\d+)"')
+_LOCATION_KEYS_RE = re.compile(r'lat"\s*[:=]\s*"?(-?\d+\.\d+)"?.*lng"\s*[:=]\s*"?(-?\d+\.\d+)"?')
+
+# +CEREG <stat> -> (log label, registered) per SDD013
+_CEREG_STAT = {
+    0: ("Not registered, not searching", False),
+    1: ("Registered, home network", True),
+    2: ("Not registered, searching/attaching", False),
+    3: ("Registration denied", False),
+    4: ("Unknown, out of coverage", False),
+    5: ("Registered, roaming", True),
+    90: ("Not registered, UICC failure", False),
+}
+
+# Message Log history kept for filtering and lines kept in the log widget (SDD012);
+# oldest entries are dropped beyond this
+_LOG_MAX_ENTRIES = 50000
+
+# Log/chat widget refresh interval in ms (~30 Hz); lines arriving in between share one update
+_UI_FLUSH_MS = 33
+
+# Message Log filter choice -> log tag (SDD012)
+_LOG_FILTER_TAGS = {"Sent": "sent", "Received": "recv", "System": "sys"}
+
+
+class LineQueue:
+    """FIFO of received modem lines shared between the receive thread and consumers (SDD017).
+
+    Backed by a deque (append/popleft are atomic) plus an Event for wakeups, so a
+    put takes no lock at all while a consumer is already signalled. Supports the
+    subset of the queue.Queue API used here and raises queue.Empty the same way.
+    """
+
+    def __init__(self):
+        self._items = deque()
+        self._ready = threading.Event()
+
+    def put(self, item):
+        self._items.append(item)
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def get(self, block=True, timeout=None):
+        if not block:
+            return self.get_nowait()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            # Clear, then re-check, so a put racing with the clear is never missed
+            self._ready.clear()
+            if self._items:
+                continue
+            if deadline is None:
+                self._ready.wait()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._ready.wait(remaining):
+                    if self._items:
+                        continue
+                    raise queue.Empty
+
+    def get_nowait(self):
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
 
 class SerialManager:
     """Manages serial communication with IoT device (SDD007, SDD009)."""
@@ -45,13 +153,18 @@ class SerialManager:
     def __init__(self, app=None):
         self.app = app  # Reference to application for GUI updates
         self.serial_port = None
+        self._fd = None  # Raw POSIX file descriptor of serial_port (None on Windows)
+        self._wake_fd = None  # Write end of the receive loop's wake-up pipe; closed by disconnect()
         self.is_connected = False
         self.receive_thread = None
-        self.receive_queue = queue.Queue()  # For backwards compatibility
-        self.response_queue = queue.Queue()  # SDD017: For AT command responses (OK, ERROR, etc.)
-        self.event_queue = queue.Queue()     # For URCs (unsolicited events starting with +)
+        self.response_queue = LineQueue()  # SDD017: For AT command responses (OK, ERROR, etc.)
+        self.event_queue = LineQueue()     # For URCs (unsolicited events starting with +)
+        self.event_ready = threading.Event()  # Set whenever a URC is queued; wakes the GUI event pump
+        self.any_line = threading.Event()  # Set whenever any line is queued; for waits that watch both queues
         self.stop_event = threading.Event()
         self.command_lock = threading.Lock()  # SDD017: Lock to ensure only one command at a time
+        self._pending_prefix = None  # Information response prefix of the outstanding query (e.g. "+CEREG:")
+        self._write_buf = bytearray()  # Reused for every command write (guarded by command_lock)
     
     @staticmethod
     def list_ports():
@@ -68,25 +181,82 @@ class SerialManager:
                 timeout=1,
                 write_timeout=1
             )
+            if hasattr(self.serial_port, "set_buffer_size"):
+                # Windows only: the default 4 KB driver queue can overrun during URC bursts
+                self.serial_port.set_buffer_size(rx_size=_SERIAL_BUFFER_SIZE, tx_size=_SERIAL_BUFFER_SIZE)
+            self._fd = self.serial_port.fileno() if os.name == "posix" else None
+            self._close_wake_fd()
+            wake_r = None
+            if self._fd is not None:
+                wake_r, self._wake_fd = os.pipe()
+            self._enable_low_latency()
             self.is_connected = True
             self.stop_event.clear()
             
             # Start receive thread
             self.receive_thread = threading.Thread(
-                target=self._receive_loop, daemon=True
+                target=self._receive_loop, args=(wake_r,), daemon=True
             )
             self.receive_thread.start()
             return True, f"Connected to {port} @ {baudrate} baud"
         except Exception as e:
             return False, str(e)
     
+    def _enable_low_latency(self):
+        """Shorten USB-serial receive latency for AT command round-trips (SDD017).
+
+        Linux: set ASYNC_LOW_LATENCY so the tty layer hands data over immediately
+        instead of waiting for the driver's latency timer (typically 16ms), and
+        drop the USB-serial latency_timer to 1ms where the adapter exposes one (FTDI).
+        Windows: return reads after a 1ms gap between characters.
+        Not every driver supports this, so failures are ignored.
+        """
+        try:
+            if sys.platform.startswith("linux"):
+                import fcntl
+                fd = self._fd
+                buf = bytearray(_SERIAL_STRUCT_SIZE)
+                fcntl.ioctl(fd, _TIOCGSERIAL, buf)
+                flags = struct.unpack_from("i", buf, _SERIAL_FLAGS_OFFSET)[0]
+                if not flags & _ASYNC_LOW_LATENCY:
+                    struct.pack_into("i", buf, _SERIAL_FLAGS_OFFSET, flags | _ASYNC_LOW_LATENCY)
+                    fcntl.ioctl(fd, _TIOCSSERIAL, buf)
+            elif sys.platform == "win32":
+                self.serial_port.inter_byte_timeout = 0.001
+        except (OSError, ValueError, serial.SerialException):
+            pass
+
+        if sys.platform.startswith("linux"):
+            # Separate from the ioctl: usually needs write access to sysfs (root or a udev rule)
+            latency_timer = os.path.join(
+                _USB_SERIAL_SYSFS, os.path.basename(os.path.realpath(self.serial_port.port)), "latency_timer"
+            )
+            try:
+                with open(latency_timer, "w") as f:
+                    f.write("1")
+            except OSError:
+                pass
+
     def disconnect(self):
         """Close serial connection."""
         self.stop_event.set()
+        # Closing the write end makes the pipe readable (EOF), so the receive loop
+        # leaves select() now instead of at its next timeout
+        self._close_wake_fd()
         if self.serial_port and self.serial_port.is_open:
             self.serial_port.close()
+        self._fd = None
         self.is_connected = False
         return True, "Disconnected"
+
+    def _close_wake_fd(self):
+        """Close the write end of the receive loop wake-up pipe, if open."""
+        if self._wake_fd is not None:
+            try:
+                os.close(self._wake_fd)
+            except OSError:
+                pass
+            self._wake_fd = None
     
     def send_command(self, command, timeout=3.0):
         """Send AT command to device (SDD005, SDD007, SDD010, SDD017).
@@ -97,99 +267,193 @@ class SerialManager:
         - Enforce 100ms delay after receiving result code
         - Log interactions for debugging
         - Implement error handling for unexpected responses
+        
+        Returns (success, response) where response is always a str: the received
+        lines joined with " | ", or an error/timeout description.
         """
-        import time
         if not self.is_connected:
             return False, "Not connected"
         
         with self.command_lock:  # SDD017: Ensure only one command is sent at a time
             try:
-                # Format as AT command if needed
-                if not command.upper().startswith("AT"):
-                    command = f"AT+{command}"
+                encoded = self._prepare_command(command)
                 
                 # Send AT command
-                self.serial_port.write((command + "\r\n").encode())
+                self._write_command(encoded)
                 
                 # Wait for response with timeout (SDD017 - timeout procedure)
-                # Collect responses until we get OK or ERROR
-                responses = []
-                start_time = time.time()
-                while time.time() - start_time < timeout:
-                    try:
-                        msg = self.response_queue.get(timeout=0.1)  # Use blocking get with short timeout
-                        responses.append(msg)
-                        # Stop waiting when we get a result code (OK, ERROR)
-                        if msg.startswith("OK") or msg.startswith("ERROR"):
-                            break
-                    except queue.Empty:
-                        continue
+                responses = self._read_response(timeout)
                 
                 # If no response within timeout, return timeout error (SDD017)
                 if not responses:
                     return False, f"Timeout: No response after {timeout}s"
                 
                 # Enforce 100ms delay after receiving result code per SDD017/ITU-T V.250
-                time.sleep(0.1)
+                time.sleep(_MIN_GUARD_TIME)
                 
                 return True, " | ".join(responses)
+            except serial.SerialTimeoutException:
+                # write_timeout expired: the modem is not draining its input (flow control/hang)
+                return False, f"Timeout: Command not written within {self.serial_port.write_timeout}s"
             except Exception as e:
                 return False, str(e)
-    
-    def _receive_loop(self):
+            finally:
+                self._pending_prefix = None
+
+    def _prepare_command(self, command):
+        """Encode one command line and register its query prefix (caller holds command_lock).
+
+        The "AT+" prefix is added if missing. For a query, the information response (e.g. "+CEREG: 5,1" for AT+CEREG?) belongs to
+        this command, not to the URC stream, so its prefix is recorded in _pending_prefix
+        for _route_line; the caller clears it once the response has been read.
+        """
+        # Format as AT command if needed
+        if not command.upper().startswith("AT"):
+            command = f"AT+{command}"
+        encoded = command.encode()
+        self._pending_prefix = encoded[2:-1].decode() + ":" if encoded.endswith(b"?") else None
+        return encoded
+
+    def _write_command(self, encoded):
+        """Write one encoded command line plus CR LF from the reusable buffer (caller holds command_lock)."""
+        buf = self._write_buf
+        buf.clear()
+        buf.extend(encoded)
+        buf.extend(b"\r\n")
+        self.serial_port.write(buf)
+
+    def _read_response(self, timeout):
+        """Collect response lines until a final result code (OK/ERROR) or the timeout (SDD017).
+
+        Returns the lines received, oldest first; empty if nothing arrived in time.
+        """
+        responses = []
+        monotonic = time.monotonic
+        Empty = queue.Empty
+        get_nowait = self.response_queue.get_nowait
+        get = self.response_queue.get
+        deadline = monotonic() + timeout
+        while True:
+            try:
+                msg = get_nowait()
+            except Empty:
+                # Nothing queued yet: block for whatever is left of the timeout
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    msg = get(timeout=remaining)
+                except Empty:
+                    break
+            responses.append(msg)
+            # Stop waiting when we get a result code (OK, ERROR)
+            if msg.startswith(_FINAL_RESULT_CODES):
+                break
+        return responses
+
+    def _receive_loop(self, wake_fd=None):
         """Receive data from device (SDD009, SDD011).
         Separates responses from events per SDD017.
+        
+        wake_fd is the read end of the wake-up pipe (POSIX); it is closed on exit.
         """
-        import time
-        import serial
-        buffer = ""
-        while not self.stop_event.is_set() and self.is_connected:
-            try:
-                if self.serial_port and self.serial_port.in_waiting:
-                    data = self.serial_port.read(self.serial_port.in_waiting)
-                    buffer += data.decode('utf-8', errors='ignore')
-                    
-                    # Extract complete lines
-                    while '\r\n' in buffer or '\n' in buffer:
-                        if '\r\n' in buffer:
-                            line, buffer = buffer.split('\r\n', 1)
-                        else:
-                            line, buffer = buffer.split('\n', 1)
-                        
-                        if line.strip():
-                            # Separate URCs (events) from responses (SDD017)
-                            # URCs start with + or % (SDD015: %CESQ notifications)
-                            if line.strip().startswith('+') or line.strip().startswith('%'):
-                                self.event_queue.put(line.strip())
-                            else:
-                                # OK, ERROR, and other responses
-                                self.response_queue.put(line.strip())
-                            # Also put in receive_queue for backwards compatibility
-                            self.receive_queue.put(line.strip())
-                else:
-                    # Small sleep to avoid busy-waiting
-                    time.sleep(0.01)
-            except serial.SerialException as e:
-                # Serial port disconnected or became unavailable
-                self.log_message(f"Serial port disconnected: {e}")
-                self.is_connected = False
-                # Update GUI connection status on main thread
-                if self.app:
-                    self.app.root.after(0, lambda: self.app.status_label.config(text="Status: Disconnected (Device Unplugged)"))
-                break  # Exit receive loop cleanly
-            except Exception as e:
-                # Log other unexpected errors
-                self.log_message(f"Error in receive loop: {e}")
-                import traceback
-                traceback.print_exc()
-                pass
-    
-    def get_message(self):
-        """Get received message from queue."""
+        # POSIX: wait for readiness on the raw fd (epoll/kqueue via selectors) and take
+        # whatever has arrived in one os.read(); the wake-up pipe is watched too so
+        # disconnect() ends the wait at once. Windows handles are not selectable,
+        # so block in pyserial's read(1) there and drain in_waiting behind it
+        fd = self._fd
+        selector = None
+        if fd is not None:
+            selector = selectors.DefaultSelector()
+            selector.register(fd, selectors.EVENT_READ)
+            if wake_fd is not None:
+                selector.register(wake_fd, selectors.EVENT_READ, True)  # data=True marks the wake-up
+        buffer = bytearray()
+        # Loop-invariant lookups bound once
+        stopped = self.stop_event.is_set
+        route_line = self._route_line
+        read = os.read
+        wait_readable = selector.select if selector is not None else None
         try:
-            return self.receive_queue.get_nowait()
-        except queue.Empty:
-            return None
+            while not stopped() and self.is_connected:
+                try:
+                    if wait_readable is not None:
+                        ready = wait_readable(timeout=0.5)
+                        if not ready:
+                            continue
+                        if any(key.data for key, _ in ready):
+                            break  # Woken by disconnect()
+                        data = read(fd, _READ_CHUNK_SIZE)
+                        if not data:
+                            # Readable with no data means the device went away (as in pyserial)
+                            raise serial.SerialException("device reports readiness to read but returned no data")
+                    else:
+                        # Block for the first byte (up to the 1s port timeout), then take
+                        # everything else the driver already holds in the same pass
+                        data = self.serial_port.read(1)
+                        if not data:
+                            continue
+                        waiting = self.serial_port.in_waiting
+                        if waiting:
+                            data += self.serial_port.read(waiting)
+                    buffer.extend(data)
+
+                    # Dispatch complete lines: cut once at the last b"\n" and split that
+                    # region in a single pass (CRLF and bare LF both end a line).
+                    # An unterminated fragment stays in the buffer for the next read.
+                    end = buffer.rfind(b"\n")
+                    if end >= 0:
+                        complete = bytes(buffer[:end])
+                        del buffer[:end + 1]
+                        for raw in complete.splitlines():
+                            route_line(raw)
+                except (serial.SerialException, OSError) as e:
+                    # OSError: os.read()/select() on the raw fd fail directly (e.g. EIO after
+                    # a USB unplug) instead of being wrapped in SerialException by pyserial
+                    if self.stop_event.is_set():
+                        break  # Port closed by disconnect() while a read was blocked
+                    # Serial port disconnected or became unavailable
+                    self.log_message(f"Serial port disconnected: {e}")
+                    self.is_connected = False
+                    # Update GUI connection status on main thread
+                    if self.app:
+                        self.app.root.after(0, self.app.on_device_unplugged)
+                    break  # Exit receive loop cleanly
+                except Exception as e:
+                    if self.stop_event.is_set():
+                        break
+                    # Log other unexpected errors
+                    self.log_message(f"Error in receive loop: {e}")
+                    traceback.print_exc()
+                    pass
+        finally:
+            if selector is not None:
+                selector.close()
+            if wake_fd is not None:
+                os.close(wake_fd)
+
+    def _route_line(self, data):
+        """Queue one received line as a response or an event (SDD017)."""
+        line = data.decode('utf-8', errors='ignore').strip()
+        if not line:
+            return
+        # Separate URCs (events) from responses (SDD017)
+        # URCs start with + or % (SDD015: %CESQ notifications), except the
+        # information response to an outstanding query command
+        first = line[0]
+        pending = self._pending_prefix
+        if (first == '+' or first == '%') and not (pending and line.startswith(pending)):
+            self.event_queue.put(line)
+            self.event_ready.set()
+        else:
+            # OK, ERROR, and other responses
+            self.response_queue.put(line)
+        self.any_line.set()
+
+    def log_message(self, msg):
+        """Forward a serial-layer diagnostic to the application message log (SDD012)."""
+        if self.app:
+            self.app.root.after(0, self.app.log_message, "sys", msg)
 
 
 class RemoteClientApplication:
@@ -205,6 +469,7 @@ class RemoteClientApplication:
         self.is_connected = False
         self.connection_state = "disconnected"  # SDD006: disconnected, connecting, connected
         self.urc_monitoring_active = False
+        self._registered_event = threading.Event()  # Mirrors network_registered for wait_for_network_registration
         self.network_registered = False  # SDD014: track +CEREG registration (stat 1 or 5)
         self.last_ping_notification = None  # Track %PINGCMD URC to avoid queue races (SDD036)
         
@@ -216,6 +481,8 @@ class RemoteClientApplication:
         self.signal_quality = {"rssi": 0, "rsrp": 0}
         self.rssi_threshold = -110  # dBm threshold for acceptable signal
         self.rsrp_threshold = -130  # dBm threshold for acceptable signal
+        self._last_rsrp_update = 0.0  # time.monotonic() of last RSRP display/log refresh
+        self._rsrp_refresh_job = None  # Pending root.after id of the trailing RSRP refresh
 
         # Location reporting (REQ012, SDD002, SDD034, SDD040, SDD047)
         self.location = {"lat": "--", "lon": "--"}
@@ -239,14 +506,43 @@ class RemoteClientApplication:
         self.last_socketcmd_notification = None  # SDD042: %SOCKETCMD URC for bind verification
         self.listen_socket_id = None  # SDD042: Socket ID for LISTEN (downlink receive)
         
+        # Downlink receives triggered by +CSCON:1/%SOCKETEV run one at a time on a single
+        # worker; one pending request covers any number of URCs that arrive meanwhile
+        self._rx_requests = queue.Queue(maxsize=1)
+        threading.Thread(target=self._rx_worker, daemon=True).start()
+        
+        # URC header (text before the ":") -> handler for handle_urc (SDD013, SDD015, SDD042)
+        self._urc_handlers = {
+            "%CESQ": self._on_cesq,
+            "%MEAS": self._on_meas,
+            "%%MEAS": self._on_meas,
+            "+CEREG": self._on_cereg,
+            "+CSCON": self._on_cscon,
+            "%SOCKETEV": self._on_socketev,
+            "%SOCKETDATA": self._on_socketdata,
+            "%SOCKETCMD": self._on_socketcmd,
+            "%PINGCMD": self._on_pingcmd,
+            "%XSOCKET": self._on_xsocket,
+            "%IGNSSEVU": self._on_gnss_fix,
+        }
+        
+        # Raw [RECV] modem traces in the Message Log (SDD012); mirrors the Verbose checkbox
+        # as a plain bool so worker threads and device profiles can read it without Tk
+        self.verbose_log = True
+        
+        # (epoch second, formatted timestamp) reused by every log/chat line in that second
+        self._ts_cache = (0, "")
+        
+        # Log/chat lines waiting for the next _flush_ui (REQ005-REQ007); appended from any thread
+        self._log_pending = deque()
+        self._chat_pending = deque()
+        self._ui_flush_scheduled = False
+        
         # Build GUI per SDD001 (2 columns x 3 rows layout)
         self.build_gui()
         
         # Initialize device profile after GUI is built (SDD030)
         self._update_device_profile()
-        
-        # Start polling (SDD011, SDD013, SDD015)
-        self.poll_serial()
     
     def _update_device_profile(self):
         """Update device profile based on selected device type (SDD030)."""
@@ -278,6 +574,9 @@ class RemoteClientApplication:
         
         # Row 2: REQ007 - Message Log via Serial Console (SDD012)
         self.build_log_panel(main)
+        
+        # Queued URCs are announced by _event_pump (SDD011)
+        self.root.bind("<<SerialData>>", lambda e: self.poll_serial())
     
     def build_connection_panel(self, parent):
         """REQ004: Connection Status Display (SDD006, SDD007, SDD015, SDD030)."""
@@ -298,6 +597,10 @@ class RemoteClientApplication:
         
         self.status_label = ttk.Label(status_row, text="Status: Disconnected", font=("Arial", 11, "bold"))
         self.status_label.pack(side=tk.LEFT, padx=10)
+        # Scheduled by SerialManager's receive thread when the port disappears
+        self.on_device_unplugged = partial(
+            self.status_label.config, text="Status: Disconnected (Device Unplugged)"
+        )
         
         # Signal Quality Display (SDD015 - RSRP only)
         signal_row = ttk.Frame(frame)
@@ -305,6 +608,7 @@ class RemoteClientApplication:
         
         ttk.Label(signal_row, text="RSRP: ", font=("Arial", 9)).pack(side=tk.LEFT, padx=2)
         self.rsrp_label = ttk.Label(signal_row, text="-- dBm", font=("Arial", 9, "bold"))
+        self._last_rsrp_text = "-- dBm"
         self.rsrp_label.pack(side=tk.LEFT, padx=2)
         
         # Location display (REQ012 / SDD034 - auto-populated from GNSS)
@@ -413,6 +717,7 @@ class RemoteClientApplication:
         ttk.Label(control_frame, text="Filter:").pack(side=tk.LEFT, padx=5)
         
         self.filter_var = tk.StringVar(value="All")
+        self._current_filter = "All"  # Filter the log widget currently shows
         filter_combo = ttk.Combobox(
             control_frame, textvariable=self.filter_var, width=15, 
             state='readonly', values=["All", "Sent", "Received", "System"]
@@ -422,6 +727,12 @@ class RemoteClientApplication:
         
         ttk.Button(control_frame, text="Clear Log", command=self.clear_log_with_confirmation).pack(side=tk.LEFT, padx=5)
         
+        self.verbose_var = tk.BooleanVar(value=self.verbose_log)
+        ttk.Checkbutton(
+            control_frame, text="Verbose", variable=self.verbose_var,
+            command=lambda: setattr(self, "verbose_log", self.verbose_var.get())
+        ).pack(side=tk.LEFT, padx=5)
+        
         # Log display
         self.log_text = scrolledtext.ScrolledText(frame, height=10, width=80, state='disabled')
         self.log_text.grid(row=1, column=0, sticky='nsew')
@@ -431,8 +742,9 @@ class RemoteClientApplication:
         self.log_text.tag_configure('recv', foreground='green')
         self.log_text.tag_configure('sys', foreground='red')
         
-        # Store full log for filtering
-        self.full_log = []
+        # Store full log (SDD012); filtering hides lines in the widget by tag instead
+        self.full_log = deque(maxlen=_LOG_MAX_ENTRIES)
+        self._clear_confirm = None  # Open "Clear Log" confirmation window, if any
     
     def update_status(self):
         """Update status indicator (SDD006).
@@ -504,6 +816,9 @@ class RemoteClientApplication:
             self.is_connected = True
             self.log_message("sys", f"Connected to {port} @ {baud} baud")
             
+            # Deliver URCs to the GUI as they arrive (SDD011, SDD013, SDD015)
+            threading.Thread(target=self._event_pump, daemon=True).start()
+            
             # Device-specific handshake (SDD031 Thingy:91 X, SDD032 Murata)
             if not self._handshake_device():
                 self.disconnect()
@@ -544,10 +859,11 @@ class RemoteClientApplication:
 
         # Murata Type 1SC-NTN (SDD032): send ATZ and wait for %BOOTEV:0 URC
         if "murata" in device or "type1sc" in device:
-            import time
             self.log_message("sent", "[SEND] ATZ")
             # Use raw write inside command lock to avoid races
             with self.serial.command_lock:
+                any_line = self.serial.any_line
+                any_line.clear()
                 try:
                     self.serial.serial_port.write(("ATZ\r\n").encode())
                 except Exception as e:
@@ -558,24 +874,33 @@ class RemoteClientApplication:
                 got_boot = False
                 start = time.time()
                 timeout = 30.0  # Increased timeout: %BOOTEV:0 can be delayed for Murata
+                deadline = time.monotonic() + timeout
                 self.log_message("sys", f"[INFO] Waiting for %BOOTEV:0 (timeout={timeout}s)...")
-                while time.time() - start < timeout:
+                # Sleep until a line lands on either queue, then log everything queued so far
+                while True:
+                    any_line.clear()
                     try:
-                        evt = self.serial.event_queue.get(timeout=0.2)
-                        self.log_message("recv", f"[RECV] {evt}")
-                        if "%BOOTEV:0" in evt:
-                            elapsed = time.time() - start
-                            self.log_message("sys", f"[SUCCESS] Murata handshake complete (%BOOTEV:0 received in {elapsed:.1f}s)")
-                            got_boot = True
-                            break
+                        while True:
+                            evt = self.serial.event_queue.get_nowait()
+                            self.log_message("recv", f"[RECV] {evt}")
+                            if "%BOOTEV:0" in evt:
+                                elapsed = time.time() - start
+                                self.log_message("sys", f"[SUCCESS] Murata handshake complete (%BOOTEV:0 received in {elapsed:.1f}s)")
+                                got_boot = True
+                                break
                     except queue.Empty:
                         pass
                     # Also log plain responses if any
                     try:
-                        resp = self.serial.response_queue.get_nowait()
-                        self.log_message("recv", f"[RECV] {resp}")
+                        while True:
+                            resp = self.serial.response_queue.get_nowait()
+                            self.log_message("recv", f"[RECV] {resp}")
                     except queue.Empty:
                         pass
+                    remaining = deadline - time.monotonic()
+                    if got_boot or remaining <= 0:
+                        break
+                    any_line.wait(remaining)
 
                 if not got_boot:
                     elapsed = time.time() - start
@@ -680,152 +1005,134 @@ class RemoteClientApplication:
         - %CESQ: RSRP notifications (SDD015/SDD044)
         - %MEAS: RSRP notifications (SDD045)
         - +CMT, +CDS, etc: Message/data URCs
+        
+        Each URC goes to the handler registered in self._urc_handlers for its header.
         """
         self._maybe_update_location_from_message(message)
         
-        if message.startswith("%IGNSSEVU"):
-            # Handle GNSS fix notification (REQ012, SDD034) - extract lat/lon
-            self.log_message("sys", f"[URC] GNSS fix: {message}")
-            try:
-                # Format: %IGNSSEVU: "FIX",1,"13:51:02","27/01/2026","51.143392","17.153273","32.1",1769521862000,9.5,"0.000000","B",4
-                # Latitude is field 5, longitude is field 6 (0-indexed: 4, 5)
-                match = re.search(r'%IGNSSEVU:\s*"[^"]+",\d+,"[^"]+","[^"]+","(-?\d+\.\d+)","(-?\d+\.\d+)"', message)
-                if match:
-                    lat = match.group(1)
-                    lon = match.group(2)
-                    self.set_location(lat, lon, source="GNSS")
-            except Exception as e:
-                self.log_message("sys", f"[ERROR] Failed to parse GNSS location: {e}")
-        
-        if message.startswith("+CEREG"):
-            # Network registration status per SDD013
-            try:
-                # Parse +CEREG format
-                parts = message.split(":")[1].strip().split(",")
-                
-                # Distinguish query response from URC:
-                # Query response: +CEREG: <n>,<stat> - exactly 2 integer parameters
-                # URC: +CEREG: <stat>[,<tac>,<ci>,<AcT>,...] - 1 param or includes quoted strings
-                
-                # Check if this is a query response (AT+CEREG?) being mishandled as URC
-                if len(parts) == 2 and '"' not in message:
-                    # This is a query response, not a URC - ignore it
-                    # Query responses should be handled by send_command(), not as URCs
-                    return
-                
-                self.log_message("sys", f"[URC] Network registration: {message}")
-                
-                # Parse URC: +CEREG: <stat>[,[<tac>],[<ci>],[<AcT>]...] per revised SDD013
-                stat = int(parts[0].strip())  # First parameter is <stat>
-                
-                # Per SDD013 Note: Handle all <stat> values
-                if stat == 1:
-                    self.log_message("sys", "[URC] Registered, home network (stat=1)")
-                    self.network_registered = True
-                elif stat == 5:
-                    self.log_message("sys", "[URC] Registered, roaming (stat=5)")
-                    self.network_registered = True
-                elif stat == 0:
-                    self.log_message("sys", "[URC] Not registered, not searching (stat=0)")
-                    self.network_registered = False
-                elif stat == 2:
-                    self.log_message("sys", "[URC] Not registered, searching/attaching (stat=2)")
-                    self.network_registered = False
-                elif stat == 3:
-                    self.log_message("sys", "[URC] Registration denied (stat=3)")
-                    self.network_registered = False
-                elif stat == 4:
-                    self.log_message("sys", "[URC] Unknown, out of coverage (stat=4)")
-                    self.network_registered = False
-                elif stat == 90:
-                    self.log_message("sys", "[URC] Not registered, UICC failure (stat=90)")
-                    self.network_registered = False
-                else:
-                    self.log_message("sys", f"[URC] Unrecognized stat value: {stat}")
-                    self.network_registered = False
-                self.update_status_label()
-            except (ValueError, IndexError):
-                pass
-        elif message.startswith("+CSCON"):
-            # Connection state notification per SDD013
-            self.log_message("sys", f"[URC] Connection state: {message}")
-            try:
-                state = int(message.split(":")[1].strip().split(",")[0])
-                if state == 1:
-                    # Modem indicates connected; attempt to receive pending UDP data (SDD027)
-                    threading.Thread(target=self.receive_udp_message, daemon=True).start()
-            except Exception:
-                pass
-        elif message.startswith("%CESQ"):
-            # Handle RSRP notification (SDD015)
-            self.log_message("sys", f"[URC] Signal quality: {message}")
-            try:
-                # Parse %CESQ: <rsrp>,<rsrq>,<snr>,<rscp>
-                parts = message.split(":")[1].strip().split(",")
-                if len(parts) >= 1:
-                    rsrp_value = int(parts[0].strip())
-                    # Convert to dBm per SDD015: reported_value - 141 = dBm
-                    if rsrp_value != 255:  # 255 means not known or not detectable
-                        rsrp_dbm = rsrp_value - 141
-                        self.signal_quality["rsrp"] = rsrp_dbm
-                        self.log_message("sys", f"[SIGNAL] RSRP: {rsrp_dbm} dBm")
-                        # Update GUI
-                        self.update_signal_quality_display()
-                        # Check threshold
-                        if rsrp_dbm < self.rsrp_threshold:
-                            self.log_message("sys", f"[ALERT] RSRP below threshold ({rsrp_dbm} < {self.rsrp_threshold} dBm)")
-            except (ValueError, IndexError):
-                pass
-        elif message.startswith("%MEAS") or message.startswith("%%MEAS"):
-            # Handle Murata RSRP notification (SDD045)
-            self.log_message("sys", f"[URC] Signal quality: {message}")
-            try:
-                match = re.search(r"RSRP\s*=\s*(-?\d+)", message)
-                if match:
-                    rsrp_dbm = int(match.group(1))
-                    if rsrp_dbm != 255:  # 255 means not known or not detectable
-                        self.signal_quality["rsrp"] = rsrp_dbm
-                        self.log_message("sys", f"[SIGNAL] RSRP: {rsrp_dbm} dBm")
-                        self.update_signal_quality_display()
-                        if rsrp_dbm < self.rsrp_threshold:
-                            self.log_message("sys", f"[ALERT] RSRP below threshold ({rsrp_dbm} < {self.rsrp_threshold} dBm)")
-            except Exception:
-                pass
-        elif message.startswith("%PINGCMD"):
-            # Capture ping notification for SDD036 to avoid race with device profile waits
-            self.last_ping_notification = message
-            self.log_message("sys", f"[URC] Ping result: {message}")
-        elif message.startswith("%SOCKETDATA"):
-            # Capture socket data URC for SDD042 to avoid race with device profile waits
-            self.last_socketdata_notification = message
-            self.log_message("sys", f"[URC] %SOCKETDATA: {message}")
-        elif message.startswith("%SOCKETCMD"):
-            # Capture socket command URC for SDD042 to avoid race with device profile waits
-            self.last_socketcmd_notification = message
-            self.log_message("sys", f"[URC] %SOCKETCMD: {message}")
-        elif message.startswith("%SOCKETEV"):
-            # Handle socket event notification per SDD042 (Murata downlink data ready)
-            self.log_message("sys", f"[URC] Socket event: {message}")
-            try:
-                # Parse %SOCKETEV:<session_id>,<socket_id> per updated SDD042
-                parts = message.split(":")[1].strip().split(",")
-                if len(parts) >= 2:
-                    session_id = int(parts[0].strip())
-                    socket_id = int(parts[1].strip())
-                    # Data available on specified socket; attempt to receive per SDD042 step 2
-                    # Check if this matches the LISTEN socket ID (typically socket 2 if socket 1 is OPEN to Harvest)
-                    if self.listen_socket_id and socket_id == int(self.listen_socket_id):
-                        self.log_message("sys", f"[INFO] Data available on LISTEN socket {socket_id} (session {session_id}) per %SOCKETEV:{session_id},{socket_id} - issuing receive (SDD042)")
-                        threading.Thread(target=self.receive_udp_message, daemon=True).start()
-                    else:
-                        self.log_message("sys", f"[INFO] Socket event on socket {socket_id} (session {session_id}), but LISTEN socket is {self.listen_socket_id}")
-            except (ValueError, IndexError):
-                pass
-        elif message.startswith("%XSOCKET"):
-            # Handle socket creation response (SDD018)
-            self.log_message("sys", f"[URC] Socket response: {message}")
+        handler = self._urc_handlers.get(message.partition(":")[0].rstrip())
+        if handler is not None:
+            handler(message)
+            return
+        self.log_message("sys", f"[URC] {message}")
+    
+    def _on_gnss_fix(self, message):
+        """Handle GNSS fix notification (REQ012, SDD034) - extract lat/lon."""
+        self.log_message("sys", f"[URC] GNSS fix: {message}")
+        try:
+            # Format: %IGNSSEVU: "FIX",1,"13:51:02","27/01/2026","51.143392","17.153273","32.1",1769521862000,9.5,"0.000000","B",4
+            # Latitude is field 5, longitude is field 6 (0-indexed: 4, 5)
+            match = re.search(r'%IGNSSEVU:\s*"[^"]+",\d+,"[^"]+","[^"]+","(-?\d+\.\d+)","(-?\d+\.\d+)"', message)
+            if match:
+                lat = match.group(1)
+                lon = match.group(2)
+                self.set_location(lat, lon, source="GNSS")
+        except Exception as e:
+            self.log_message("sys", f"[ERROR] Failed to parse GNSS location: {e}")
+    
+    def _on_cereg(self, message):
+        """Network registration status per SDD013."""
+        # Parse +CEREG format (AT+CEREG? query responses are routed to
+        # send_command() by SerialManager and never reach this handler)
+        self.log_message("sys", f"[URC] Network registration: {message}")
+        
+        # Parse URC: +CEREG: <stat>[,[<tac>],[<ci>],[<AcT>]...] per revised SDD013
+        match = _CEREG_URC_RE.match(message)
+        if not match:
+            return
+        stat = int(match.group(1))  # First parameter is <stat>
+        
+        # Per SDD013 Note: Handle all <stat> values
+        info = _CEREG_STAT.get(stat)
+        if info:
+            label, registered = info
+            self.log_message("sys", f"[URC] {label} (stat={stat})")
+            self.network_registered = registered
         else:
-            self.log_message("sys", f"[URC] {message}")
+            self.log_message("sys", f"[URC] Unrecognized stat value: {stat}")
+            self.network_registered = False
+        self.update_status_label()
+    
+    def _on_cscon(self, message):
+        """Connection state notification per SDD013."""
+        self.log_message("sys", f"[URC] Connection state: {message}")
+        try:
+            state = int(message.split(":")[1].strip().split(",")[0])
+            if state == 1:
+                # Modem indicates connected; attempt to receive pending UDP data (SDD027)
+                self.request_udp_receive()
+        except Exception:
+            pass
+    
+    def _on_cesq(self, message):
+        """Handle RSRP notification (SDD015)."""
+        self.log_message("sys", f"[URC] Signal quality: {message}")
+        # Parse %CESQ: <rsrp>,<rsrq>,<snr>,<rscp> - only <rsrp> is needed
+        match = _CESQ_URC_RE.match(message)
+        if not match:
+            return
+        rsrp_value = int(match.group(1))
+        # Convert to dBm per SDD015: reported_value - 141 = dBm
+        if rsrp_value != 255:  # 255 means not known or not detectable
+            self._report_rsrp(rsrp_value - 141)
+    
+    def _on_meas(self, message):
+        """Handle Murata RSRP notification (SDD045)."""
+        self.log_message("sys", f"[URC] Signal quality: {message}")
+        try:
+            match = re.search(r"RSRP\s*=\s*(-?\d+)", message)
+            if match:
+                rsrp_dbm = int(match.group(1))
+                if rsrp_dbm != 255:  # 255 means not known or not detectable
+                    self._report_rsrp(rsrp_dbm)
+        except Exception:
+            pass
+    
+    def _on_pingcmd(self, message):
+        """Capture ping notification for SDD036 to avoid race with device profile waits."""
+        self.last_ping_notification = message
+        self.log_message("sys", f"[URC] Ping result: {message}")
+    
+    def _on_socketdata(self, message):
+        """Capture socket data URC for SDD042 to avoid race with device profile waits."""
+        self.last_socketdata_notification = message
+        self.log_message("sys", f"[URC] %SOCKETDATA: {message}")
+    
+    def _on_socketcmd(self, message):
+        """Capture socket command URC for SDD042 to avoid race with device profile waits."""
+        self.last_socketcmd_notification = message
+        self.log_message("sys", f"[URC] %SOCKETCMD: {message}")
+    
+    @property
+    def listen_socket_id(self):
+        """SDD042: Socket ID of the LISTEN socket (downlink receive) as set by the device profile, or None."""
+        return self._listen_socket_id
+    
+    @listen_socket_id.setter
+    def listen_socket_id(self, value):
+        self._listen_socket_id = value
+        # Parsed once here instead of on every %SOCKETEV
+        self.listen_socket_num = int(value) if value else None
+    
+    def _on_socketev(self, message):
+        """Handle socket event notification per SDD042 (Murata downlink data ready)."""
+        self.log_message("sys", f"[URC] Socket event: {message}")
+        # Parse %SOCKETEV:<session_id>,<socket_id> per updated SDD042
+        match = _SOCKETEV_URC_RE.match(message)
+        if not match:
+            return
+        session_id, socket_id = int(match.group(1)), int(match.group(2))
+        # Data available on specified socket; attempt to receive per SDD042 step 2
+        # Check if this matches the LISTEN socket ID (typically socket 2 if socket 1 is OPEN to Harvest)
+        if socket_id == self.listen_socket_num:
+            self.log_message("sys", f"[INFO] Data available on LISTEN socket {socket_id} (session {session_id}) per %SOCKETEV:{session_id},{socket_id} - issuing receive (SDD042)")
+            self.request_udp_receive()
+        else:
+            self.log_message("sys", f"[INFO] Socket event on socket {socket_id} (session {session_id}), but LISTEN socket is {self.listen_socket_id}")
+    
+    def _on_xsocket(self, message):
+        """Handle socket creation response (SDD018)."""
+        self.log_message("sys", f"[URC] Socket response: {message}")
     
     def activate_pdp_context(self):
         """Configure PDP context for SORACOM APN (SDD014/SDD035/SDD036).
@@ -850,19 +1157,28 @@ class RemoteClientApplication:
         
         return success
     
-    def wait_for_network_registration(self, timeout=30, interval=0.1):
+    @property
+    def network_registered(self):
+        """SDD014: True while the last +CEREG URC reported stat 1 or 5."""
+        return self._registered_event.is_set()
+    
+    @network_registered.setter
+    def network_registered(self, value):
+        if value:
+            self._registered_event.set()
+        else:
+            self._registered_event.clear()
+    
+    def wait_for_network_registration(self, timeout=30):
         """Wait for +CEREG URC with stat=1/5 per SDD013.
         
         Per SDD013: Successful establishment indicated by unsolicited +CEREG notification,
-        NOT by querying AT+CEREG?. This function passively waits for the URC.
+        NOT by querying AT+CEREG?. This function passively waits for the URC, blocking
+        on the registration event that _on_cereg sets.
         """
-        import time
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            if self.network_registered:
-                self.log_message("sys", "[VERIFY] Network registration confirmed via +CEREG URC (SDD013)")
-                return True
-            time.sleep(interval)  # Wait for URC to arrive
+        if self._registered_event.wait(timeout):
+            self.log_message("sys", "[VERIFY] Network registration confirmed via +CEREG URC (SDD013)")
+            return True
         return False
     
     def monitor_signal_quality(self):
@@ -927,6 +1243,25 @@ class RemoteClientApplication:
             self.udp_bound = False
             return False
 
+    def request_udp_receive(self):
+        """Queue a receive_udp_message run on the rx worker (SDD027/SDD042).
+        
+        Dropped if a request is already waiting: that run will pick up this data too.
+        """
+        try:
+            self._rx_requests.put_nowait(True)
+        except queue.Full:
+            pass
+    
+    def _rx_worker(self):
+        """Run queued UDP receives one at a time for the life of the application."""
+        while True:
+            self._rx_requests.get()
+            try:
+                self.receive_udp_message()
+            except Exception as e:
+                self.log_message("sys", f"[ERROR] UDP receive failed: {e}")
+    
     def receive_udp_message(self):
         """Receive UDP message using device profile (SDD041/SDD042).
         
@@ -955,28 +1290,58 @@ class RemoteClientApplication:
         if result:
             ip_addr, port, payload = result
             self.log_message("sys", f"[SUCCESS] Received UDP from {ip_addr}:{port} (SDD041/SDD042)")
-            self.log_message("recv", f"[RECV] {payload}")
-            self.display_chat_message("recv", f"[RECV] {payload}")
+            entry = f"[RECV] {payload}"
+            self.log_message("recv", entry)
+            self.display_chat_message("recv", entry)
         else:
             # No message received - this is normal for polling
             pass
     
+    def _report_rsrp(self, rsrp_dbm):
+        """Store an RSRP reading and refresh display/log at most once per second (SDD015).
+        
+        A reading that arrives within a second of the last refresh is kept and shown
+        by a single trailing refresh when the second is up. The low-signal alert is
+        checked for every reading.
+        """
+        self.signal_quality["rsrp"] = rsrp_dbm
+        if rsrp_dbm < self.rsrp_threshold:
+            self.log_message("sys", f"[ALERT] RSRP below threshold ({rsrp_dbm} < {self.rsrp_threshold} dBm)")
+        if self._rsrp_refresh_job is not None:
+            return  # Already scheduled; it will show this newest value
+        remaining = self._last_rsrp_update + 1.0 - time.monotonic()
+        if remaining > 0:
+            self._rsrp_refresh_job = self.root.after(int(remaining * 1000) + 1, self._refresh_rsrp)
+        else:
+            self._refresh_rsrp()
+    
+    def _refresh_rsrp(self):
+        """Log and display the newest stored RSRP reading (SDD015)."""
+        self._rsrp_refresh_job = None
+        self._last_rsrp_update = time.monotonic()
+        self.log_message("sys", f"[SIGNAL] RSRP: {self.signal_quality['rsrp']} dBm")
+        self.update_signal_quality_display()
+
     def update_signal_quality_display(self):
         """Update GUI signal quality display (SDD015/SDD044/SDD045 - RSRP only)."""
-        try:
-            rsrp_text = f"{self.signal_quality['rsrp']} dBm" if self.signal_quality["rsrp"] != 0 else "-- dBm"
+        rsrp = self.signal_quality["rsrp"]
+        rsrp_text = f"{rsrp} dBm" if rsrp != 0 else "-- dBm"
+        # Skip the Tk round-trip when the label already shows this value
+        if rsrp_text != self._last_rsrp_text:
             self.rsrp_label.config(text=rsrp_text)
-        except:
-            pass
+            self._last_rsrp_text = rsrp_text
 
     def _maybe_update_location_from_message(self, message: str):
         """Extract latitude/longitude from URCs or data strings when present (REQ012)."""
+        # Both forms need a decimal point; most URCs (%CESQ, +CEREG, %SOCKETEV) have none
+        if "." not in message:
+            return
         try:
             # Match two decimal numbers wrapped in quotes (e.g., "51.123","17.456")
-            match = re.search(r'"(-?\d{1,3}\.\d+)",\s*"(-?\d{1,3}\.\d+)"', message)
+            match = _LOCATION_PAIR_RE.search(message)
             if not match:
                 # Also handle key/value JSON-like patterns lat/lng
-                match = re.search(r'lat"\s*[:=]\s*"?(-?\d+\.\d+)"?.*lng"\s*[:=]\s*"?(-?\d+\.\d+)"?', message)
+                match = _LOCATION_KEYS_RE.search(message)
             if match:
                 lat, lon = match.group(1), match.group(2)
                 self.set_location(lat, lon, source="URC")
@@ -984,10 +1349,9 @@ class RemoteClientApplication:
             pass
 
     def update_location_display(self):
-        try:
-            self.location_var.set(f"{self.location['lat']} , {self.location['lon']}")
-        except Exception:
-            pass
+        """Show the stored location in the connection panel (REQ012)."""
+        # location_var exists from build_connection_panel on, before any location can be set
+        self.location_var.set(f"{self.location['lat']} , {self.location['lon']}")
 
     def set_location(self, lat: str, lon: str, source: str = "manual"):
         """Update stored location and refresh display (REQ012)."""
@@ -1062,6 +1426,9 @@ class RemoteClientApplication:
         Delegates to device profile for device-specific send operations:
         - SDD039: Nordic uses AT#XSENDTO with ASCII payload
         - SDD040: Murata uses AT%SOCKETDATA with HEX-encoded payload
+        
+        Returns True once the send has been handed to the worker thread; its
+        outcome is reported later by _on_harvest_sent. False if it was not started.
         """
         if not self.is_connected:
             self.log_message("sys", "[ERROR] Not connected - cannot send to Harvest Data")
@@ -1071,37 +1438,61 @@ class RemoteClientApplication:
             self.log_message("sys", "[ERROR] Empty message - cannot send to Harvest Data")
             return False
 
-        # Ensure location message is sent once before any other payload (REQ012/SDD040/SDD047)
-        if not self.ensure_location_sent():
+        # Location must be known before the first payload (REQ012/SDD047); prompt here on the GUI thread
+        if not self.location_sent and not self._has_location():
+            messagebox.showwarning(
+                "Location Required",
+                "Set latitude/longitude before sending messages (REQ012). Use 'Set Location' or wait for device URC with coordinates."
+            )
             return False
-        
-        # Use device profile to send per SDD039/SDD040
-        success = self.device_profile.send_to_harvest(self.serial, data)
-        
+
+        # The modem round-trip runs on a worker so the GUI stays responsive;
+        # Send is re-enabled once the result is back
+        self.send_btn.config(state='disabled')
+        threading.Thread(target=self._send_to_harvest_worker, args=(data,), daemon=True).start()
+        return True
+
+    def _send_to_harvest_worker(self, data):
+        """Worker for send_to_harvest_data: location first, then the payload (SDD019/SDD047)."""
+        success = False
+        try:
+            # Ensure location message is sent once before any other payload (REQ012/SDD040/SDD047)
+            if self.ensure_location_sent():
+                # Use device profile to send per SDD039/SDD040
+                success = self.device_profile.send_to_harvest(self.serial, data)
+        finally:
+            self.root.after(0, self._on_harvest_sent, data, success)
+
+    def _on_harvest_sent(self, data, success):
+        """Report a send_to_harvest_data result on the GUI thread (SDD019)."""
         if success:
             self.log_message("sys", "[SUCCESS] Sent message to Soracom Harvest Data (SDD019)")
             self.log_message("sent", f"[SEND] {data}")
             self.display_chat_message("sent", f"[SEND] {data}")
-            return True
         else:
             self.log_message("sys", "[ERROR] Failed to send message to Soracom Harvest Data (SDD019)")
-            return False
+        # A reconnect during the send resets pdp_ready; Send stays off until it is configured again
+        if self.is_connected and self.pdp_ready:
+            self.send_btn.config(state='normal')
+
+    def _has_location(self):
+        """Return True when both latitude and longitude are set (REQ012)."""
+        lat = self.location.get("lat")
+        lon = self.location.get("lon")
+        return bool(lat and lon and lat != "--" and lon != "--")
 
     def ensure_location_sent(self):
         """Send location payload once after connect, before first data message (REQ012/SDD040/SDD047)."""
         if self.location_sent:
             return True
 
+        if not self._has_location():
+            self.log_message("sys", "[ERROR] Location not set - cannot send location message (REQ012)")
+            return False
+
         lat = self.location.get("lat")
         lon = self.location.get("lon")
 
-        if not lat or not lon or lat == "--" or lon == "--":
-            messagebox.showwarning(
-                "Location Required",
-                "Set latitude/longitude before sending messages (REQ012). Use 'Set Location' or wait for device URC with coordinates."
-            )
-            return False
-
         payload = f'["LOCATION","{lat}","{lon}"]'
         success = self.device_profile.send_to_harvest(self.serial, payload)
 
@@ -1115,84 +1506,203 @@ class RemoteClientApplication:
             self.log_message("sys", "[ERROR] Failed to send location message (REQ012/SDD047)")
             return False
     
+    def _timestamp(self):
+        """Return the current time as "YYYY-MM-DD HH:MM:SS", formatted at most once per second."""
+        now = int(time.time())
+        second, text = self._ts_cache
+        if now != second:
+            # Same text as strftime("%Y-%m-%d %H:%M:%S") without parsing a format string
+            text = datetime.fromtimestamp(now).isoformat(sep=" ", timespec="seconds")
+            # Single tuple assignment so threads logging concurrently never see a torn pair
+            self._ts_cache = (now, text)
+        return text
+
     def log_message(self, tag, msg):
         """Log message with timestamp (REQ007, SDD012)."""
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{ts}] {msg}"
+        ts = self._timestamp()
+        self._log_pending.append((tag, f"[{ts}] {msg}"))
+        self._schedule_ui_flush()
 
-        # Store for filtering (SDD012)
-        self.full_log.append((tag, log_entry))
+    def _schedule_ui_flush(self):
+        """Arrange one _flush_ui call about a frame from now, unless one is already due."""
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            self.root.after(_UI_FLUSH_MS, self._flush_ui)
+
+    def _flush_ui(self):
+        """Write all pending log and chat lines to their widgets (REQ005-REQ007, SDD012).
         
+        Lines are queued by log_message/display_chat_message and written here at most
+        once per _UI_FLUSH_MS, one widget update per area however many lines arrived.
+        """
+        # Reset first: a line queued while draining schedules the next flush itself
+        self._ui_flush_scheduled = False
+        if self._log_pending:
+            self._flush_log_batch(self._drain(self._log_pending))
+        if self._chat_pending:
+            batch = self._drain(self._chat_pending)
+            self.chat_display.config(state='normal')
+            self.chat_display.insert('end', *self._tagged_runs(batch, ""))
+            self.chat_display.config(state='disabled')
+            self.chat_display.see('end')
+
+    @staticmethod
+    def _drain(pending):
+        """Pop everything currently in a pending deque, oldest first."""
+        batch = []
+        try:
+            while True:
+                batch.append(pending.popleft())
+        except IndexError:
+            pass
+        return batch
+
+    @staticmethod
+    def _tagged_runs(batch, end):
+        """Flatten (tag, entry) pairs into Text.insert's text, tag, text, tag... arguments.
+        
+        Consecutive entries with the same tag are joined into one text chunk, so a
+        whole batch is written by a single insert call.
+        """
+        args = []
+        for tag, run in groupby(batch, key=itemgetter(0)):
+            args.append("".join(entry + end for _, entry in run))
+            args.append(tag)
+        return args
+    
+    def _flush_log_batch(self, batch):
+        """Store and display timestamped (tag, entry) pairs in one widget update (SDD012)."""
+        # Store for filtering (SDD012)
+        self.full_log.extend(batch)
+
         self.log_text.config(state='normal')
-        self.log_text.insert('end', log_entry + "\n", tag)
+        self.log_text.insert('end', *self._tagged_runs(batch, "\n"))
+        # Keep the widget as bounded as full_log: drop the oldest lines past the cap
+        excess = int(self.log_text.index('end-1c').split('.')[0]) - 1 - _LOG_MAX_ENTRIES
+        if excess > 0:
+            self.log_text.delete('1.0', f'{excess + 1}.0')
         self.log_text.config(state='disabled')
         self.log_text.see('end')
     
     def display_chat_message(self, tag, msg):
         """Display message in chat area with timestamp (REQ005, REQ006, SDD001)."""
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        chat_entry = f"[{ts}] {msg}\n"
-        
-        self.chat_display.config(state='normal')
-        self.chat_display.insert('end', chat_entry, tag)
-        self.chat_display.config(state='disabled')
-        self.chat_display.see('end')
+        ts = self._timestamp()
+        self._chat_pending.append((tag, f"[{ts}] {msg}\n"))
+        self._schedule_ui_flush()
     
     def apply_log_filter(self):
-        """Filter log entries by type (SDD012)."""
-        filter_type = self.filter_var.get()
-        
-        # Clear display
-        self.log_text.config(state='normal')
-        self.log_text.delete('1.0', 'end')
+        """Filter log entries by type (SDD012).
         
-        # Re-display filtered entries
-        for tag, entry in self.full_log:
-            if filter_type == "All":
-                self.log_text.insert('end', entry + "\n", tag)
-            elif filter_type == "Sent" and tag == "sent":
-                self.log_text.insert('end', entry + "\n", tag)
-            elif filter_type == "Received" and tag == "recv":
-                self.log_text.insert('end', entry + "\n", tag)
-            elif filter_type == "System" and tag == "sys":
-                self.log_text.insert('end', entry + "\n", tag)
+        Every line stays in the widget; lines of the other types are hidden by
+        eliding their tags, so switching filters never re-inserts the log.
+        """
+        filter_type = self.filter_var.get()
+        if filter_type == self._current_filter:
+            return
+        self._current_filter = filter_type
         
-        self.log_text.config(state='disabled')
+        shown = _LOG_FILTER_TAGS.get(filter_type)  # None for "All"
+        for tag in ("sent", "recv", "sys"):
+            self.log_text.tag_configure(tag, elide=shown is not None and tag != shown)
         self.log_text.see('end')
     
     def clear_log_with_confirmation(self):
-        """Clear log with confirmation prompt (SDD012)."""
-        if messagebox.askyesno("Clear Log", "Are you sure you want to clear the message log? This cannot be undone."):
-            self.full_log.clear()
-            self.log_text.config(state='normal')
-            self.log_text.delete('1.0', 'end')
-            self.log_text.config(state='disabled')
-            self.log_message("sys", "Log cleared by user")
+        """Clear log with confirmation prompt (SDD012).
+        
+        The prompt is a non-modal Toplevel, so URC handling keeps running while it is open.
+        """
+        if self._clear_confirm is not None and self._clear_confirm.winfo_exists():
+            self._clear_confirm.lift()
+            return
+        
+        top = tk.Toplevel(self.root)
+        top.title("Clear Log")
+        top.transient(self.root)
+        top.resizable(False, False)
+        self._clear_confirm = top
+        
+        def close(confirmed):
+            top.destroy()
+            self._clear_confirm = None
+            if confirmed:
+                self.clear_log()
+        
+        ttk.Label(
+            top, text="Are you sure you want to clear the message log? This cannot be undone.",
+            padding="10"
+        ).pack()
+        buttons = ttk.Frame(top, padding="5")
+        buttons.pack()
+        ttk.Button(buttons, text="Yes", command=lambda: close(True)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="No", command=lambda: close(False)).pack(side=tk.LEFT, padx=5)
+        top.protocol("WM_DELETE_WINDOW", lambda: close(False))
     
+    def clear_log(self):
+        """Clear stored and displayed log entries (SDD012)."""
+        self._log_pending.clear()
+        self.full_log.clear()
+        self.log_text.config(state='normal')
+        self.log_text.delete('1.0', 'end')
+        self.log_text.config(state='disabled')
+        self.log_message("sys", "Log cleared by user")
+    
+    def _event_pump(self):
+        """Post <<SerialData>> to the Tk loop whenever the serial layer queues a URC (SDD011).
+
+        Runs on its own thread for the life of the connection; the virtual event is
+        bound to poll_serial in build_gui. It only waits for the event_ready signal and
+        never consumes event_queue, so device profiles that read URCs directly (e.g.
+        Murata boot/GNSS waits) are unaffected. Events that arrive while a poll is
+        pending are coalesced into that poll.
+
+        The receive thread does not post this event itself: a cross-thread Tk call waits
+        for the main loop, which may be blocked in send_command waiting on that thread.
+        It still calls root.after for its own error paths only, i.e. the diagnostics sent
+        through SerialManager.log_message and the on_device_unplugged notice; received
+        lines never cross into Tk from it.
+        """
+        ready = self.serial.event_ready
+        ready.set()  # Drain anything queued before the pump started
+        while self.serial.is_connected:
+            if ready.wait(timeout=0.5):
+                ready.clear()
+                self.root.event_generate("<<SerialData>>", when="tail")
+
     def poll_serial(self):
         """Poll for unsolicited events (URCs) only (REQ006, SDD011, SDD013).
         Command responses are handled inside send_command to comply with SDD017.
         Displays received messages in unified chat area (SDD001, SDD011).
         Per SDD011: Chat must NOT display AT command responses or URCs from the modem.
+        Runs on <<SerialData>> from _event_pump when URCs are queued rather than on a fixed timer.
+        SerialManager does the line framing: event_queue only ever holds complete,
+        stripped, non-empty lines, so messages are dispatched without re-checking.
         """
         if self.is_connected:
+            # Bound methods hoisted out of the drain loop
+            messages = []
+            append = messages.append
+            get_nowait = self.serial.event_queue.get_nowait
             while True:
                 try:
-                    msg = self.serial.event_queue.get_nowait()
+                    append(get_nowait())
                 except queue.Empty:
                     break
-                
+            
+            if messages:
                 # Per SDD011: Only display actual messages, not modem responses or URCs
                 # URCs (starting with +, %, #) are handled separately, not displayed in chat
                 # The chat area is reserved for messages from Communicator Application only
                 
-                # Log all received data for debugging (SDD012)
-                self.log_message("recv", f"[RECV] {msg}")
+                # Log all received data for debugging (SDD012) - one widget update per tick
+                if self.verbose_log:
+                    ts = self._timestamp()
+                    self._log_pending.extend([("recv", f"[{ts}] [RECV] {msg}") for msg in messages])
+                    self._schedule_ui_flush()
                 
                 # Handle URCs separately (SDD013, SDD015, etc) without displaying in chat
-                self.handle_urc(msg)
-        
-        self.root.after(100, self.poll_serial)
+                handle_urc = self.handle_urc
+                for msg in messages:
+                    handle_urc(msg)
 
 def main():
     root = tk.Tk()